@@ -43,6 +43,7 @@ ROT_SPEED = np.radians(1)
 INITIAL_ORIENT = np.radians(0)
 
 DETECTION_PERIOD = 30
+SENSING_BUDGET = 1
 NUM_SENSORS = 10
 MIN_RANGE = 20
 MAX_RANGE = 300
@@ -128,19 +129,27 @@ def draw_track(track, line_data_size):
         pygame.draw.line(WIN, ORANGE, start_pos, end_pos)
 
 
-def draw_detection(detection, detection_data_size):
+def make_detection_sprite(size):
 
-    centre = detection.measurement_model.inverse_function(detection)
-    centre = centre[(0, 2), :].flatten()
-    top_left = centre + DETECTION_SIZE * np.array([-1, -1])
-    top_right = centre + DETECTION_SIZE * np.array([1, -1])
-    bottom_left = centre + DETECTION_SIZE * np.array([-1, 1])
-    bottom_right = centre + DETECTION_SIZE * np.array([1, 1])
-    pygame.draw.line(WIN, GREEN, top_left, bottom_right)
-    pygame.draw.line(WIN, GREEN, bottom_left, top_right)
+    sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+    pygame.draw.line(sprite, GREEN, (0, 0), (2 * size, 2 * size))
+    pygame.draw.line(sprite, GREEN, (0, 2 * size), (2 * size, 0))
 
+    return sprite
 
-def show_display(minimap, player, destinations, destinations_reached, detected, tracks, sensors):
+
+DETECTION_SPRITE = make_detection_sprite(DETECTION_SIZE)
+
+
+def draw_detections(detection_positions):
+
+    top_lefts = (detection_positions - DETECTION_SIZE).tolist()
+    WIN.blits([(DETECTION_SPRITE, top_left) for top_left in top_lefts],
+              doreturn=False)
+
+
+def show_display(minimap, player, destinations, destinations_reached, detected, tracks, sensors,
+                 scheduler):
 
     WIN.blit(minimap, (0, 0))
 
@@ -181,17 +190,22 @@ def show_display(minimap, player, destinations, destinations_reached, detected,
         WIN.blit(speedometer_text,
                  (DISPLAY_OFFSET[0], DISPLAY_OFFSET[1]+MINIMAP_HEIGHT+40))
 
+    sensor_load_text = SPEEDOMETER_FONT.render(
+        f"Planned sensor load: {scheduler.peak_load} peak, "
+        f"{round(scheduler.mean_load, 2)} mean", 1, WHITE)
+    WIN.blit(sensor_load_text,
+             (DISPLAY_OFFSET[0], DISPLAY_OFFSET[1]+MINIMAP_HEIGHT+50))
+
 
 def draw_window(_map, minimap, player,
                 destinations, destinations_reached,
-                sensors, tracks, all_detections, detected,
+                sensors, scheduler, tracks, detection_positions, detected,
                 display_all: bool):
 
     if display_all:
-        line_data_size = detection_data_size = 0
+        line_data_size = 0
     else:
         line_data_size = LINE_DATA_SIZE
-        detection_data_size = DETECTION_DATA_SIZE
 
     WIN.blit(_map, (0, 0))
 
@@ -202,10 +216,8 @@ def draw_window(_map, minimap, player,
 
     for track in tracks:
         draw_track(track, line_data_size)
-    #
-    # for detections in all_detections[-detection_data_size:]:
-    #     for detection in detections:
-    #         draw_detection(detection, detection_data_size)
+
+    draw_detections(detection_positions)
 
     if not display_all:
         reveal_surface = pygame.Surface((WIDTH, HEIGHT))
@@ -220,7 +232,8 @@ def draw_window(_map, minimap, player,
         pygame.draw.ellipse(reveal_surface, RED, rect)
         WIN.blit(reveal_surface, (0, 0))
 
-    show_display(minimap, player, destinations, destinations_reached, detected, tracks, sensors)
+    show_display(minimap, player, destinations, destinations_reached, detected, tracks, sensors,
+                 scheduler)
 
     pygame.display.update()
 
@@ -264,9 +277,7 @@ def main():
 
     sensors = random_sensors()
     
-    tracker = make_tracker(sensors, DETECTION_PERIOD)
-
-    all_detections = list()
+    tracker = make_tracker(sensors, DETECTION_PERIOD, SENSING_BUDGET, DETECTION_DATA_SIZE)
 
     destinations_reached = 0
 
@@ -285,7 +296,7 @@ def main():
                 if destinations_reached == NUM_DESTINATIONS:
                     end_game(_map, minimap, player,
                              destination_history, destinations_reached,
-                             tracker, tracker.tracks, all_detections)
+                             tracker, tracker.tracks)
                     run = False
                 destination = random_destination()
                 destination_history.append(destination)
@@ -297,16 +308,12 @@ def main():
 
         player_move(player, keys_pressed)
 
-        if turn % DETECTION_PERIOD == 0:
-            _, tracks = tracker.track(time, player, True)
-        else:
-            _, tracks = tracker.track(time, player, False)
-
-        all_detections = tracker.all_detections
+        _, tracks = tracker.track(time, player, turn)
 
         draw_window(_map, minimap, player,
                     [destination], destinations_reached,
-                    tracker.sensors, tracks, all_detections, tracker.detected,
+                    tracker.sensors, tracker.scheduler, tracks,
+                    tracker.detection_positions, tracker.detected,
                     display_all=False)
         handle_destination(player, destination)
         time += timedelta(seconds=1)
@@ -317,7 +324,7 @@ def main():
 
 
 def end_game(_map, minimap, player, destinations, destinations_reached,
-             tracker, tracks, all_detections):
+             tracker, tracks):
 
     score = metrics(tracker)
 
@@ -325,7 +332,8 @@ def end_game(_map, minimap, player, destinations, destinations_reached,
     score_text = SCORE_FONT.render(f"Score: {score}", 1, WHITE)
 
     draw_window(_map, minimap, player, destinations, destinations_reached,
-                tracker.sensors, tracks, all_detections, tracker.detected,
+                tracker.sensors, tracker.scheduler,
+                tracks, tracker.all_detection_positions(), tracker.detected,
                 display_all=True)
     WIN.blit(
         win_text,
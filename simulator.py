@@ -1,4 +1,6 @@
+import math
 import random
+from collections import deque
 
 import pygame
 import numpy as np
@@ -103,7 +105,7 @@ class Missile(Player):
     pass
 
 
-def make_tracker(sensors_info, detection_period):
+def make_tracker(sensors_info, detection_period, sensing_budget, detection_window):
 
     transition_model = CombinedLinearGaussianTransitionModel([
         ConstantVelocity(0.1),
@@ -158,24 +160,64 @@ def make_tracker(sensors_info, detection_period):
                                  detector=None,
                                  data_associator=data_associator,
                                  updater=updater)
-    tracker = GameTracker(tracker, sensors)
+    scheduler = SensorScheduler(sensors, detection_period, sensing_budget)
+    tracker = GameTracker(tracker, sensors, scheduler, detection_window)
 
     return tracker
 
 
+class SensorScheduler:
+
+    def __init__(self, sensors, revisit_period, budget):
+
+        if revisit_period <= 0:
+            raise ValueError(f"revisit_period must be positive, got {revisit_period}")
+        if budget <= 0:
+            raise ValueError(f"budget must be positive, got {budget}")
+
+        self.sensors = list(sensors)
+        self.budget = budget
+
+        # stretch the revisit period if the budget can't cover every sensor
+        self.revisit_period = max(revisit_period,
+                                  math.ceil(len(self.sensors) / budget))
+
+        # spread sensor phases evenly, so no frame exceeds the budget
+        self.schedule = [list() for _ in range(self.revisit_period)]
+        for i, sensor in enumerate(self.sensors):
+            phase = (i * self.revisit_period) // len(self.sensors)
+            self.schedule[phase].append(sensor)
+
+        # planned sensors per frame, the schedule is fixed from here on
+        loads = [len(sensors) for sensors in self.schedule]
+        self.peak_load = max(loads)
+        self.mean_load = sum(loads) / len(loads)
+
+    def due(self, turn):
+        return self.schedule[turn % self.revisit_period]
+
+
 class GameTracker:
 
-    def __init__(self, tracker, sensors):
+    def __init__(self, tracker, sensors, scheduler, detection_window):
 
         self.tracker = tracker
         self.sensors = sensors
+        self.scheduler = scheduler
 
         self.all_detections = list()
 
+        # ring buffer of the positions from the last detection_window revisits
+        self.detection_window_frames = detection_window * scheduler.revisit_period
+        self._detection_buffer = np.empty((max(detection_window * len(sensors), 1), 2))
+        self._detection_head = 0
+        self.num_detections = 0
+        self.detection_scans = deque()
+
         self.groundtruth = GroundTruthPath()
         self.tracks = set()
 
-    def track(self, time, player, detect: bool):
+    def track(self, time, player, turn):
 
         self.detected = False
 
@@ -190,8 +232,10 @@ class GameTracker:
 
         self.groundtruth.append(player_state)
 
-        if detect:
-            for sensor in self.sensors:
+        due_sensors = self.scheduler.due(turn)
+
+        if due_sensors:
+            for sensor in due_sensors:
                 detections = sensor.measure({player_state})
 
                 if detections:
@@ -201,6 +245,7 @@ class GameTracker:
                 tracks = next(iter(self.tracker))
                 detections_at_time.update(detections)
             self.all_detections.append(detections_at_time)
+            self.store_detection_positions(detections_at_time, turn)
         else:
             self.tracker.detector = [(time, set())]
             tracks = next(iter(self.tracker))
@@ -209,6 +254,39 @@ class GameTracker:
 
         return tracks
 
+    @property
+    def detection_positions(self):
+        capacity = len(self._detection_buffer)
+        start = self._detection_head - self.num_detections
+        return self._detection_buffer[(start + np.arange(self.num_detections)) % capacity]
+
+    def all_detection_positions(self):
+        return cartesian_positions([detection
+                                    for detections in self.all_detections
+                                    for detection in detections])
+
+    def store_detection_positions(self, detections, turn):
+
+        capacity = len(self._detection_buffer)
+        positions = cartesian_positions(detections)[-capacity:]
+
+        index = (self._detection_head + np.arange(len(positions))) % capacity
+        self._detection_buffer[index] = positions
+        self._detection_head = (self._detection_head + len(positions)) % capacity
+
+        self.detection_scans.append((turn, len(positions)))
+        while self.detection_scans and self.detection_scans[0][0] <= turn - self.detection_window_frames:
+            self.detection_scans.popleft()
+        self.num_detections = min(sum(count for _, count in self.detection_scans), capacity)
+
+
+def cartesian_positions(detections):
+
+    positions = [detection.measurement_model.inverse_function(detection)[(0, 2), :].ravel()
+                 for detection in detections]
+
+    return np.array(positions, dtype=float).reshape(-1, 2)
+
 
 def metrics(tracker):
 